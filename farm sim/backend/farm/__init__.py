@@ -2,5 +2,6 @@
 # This file makes the farm directory a proper Python package 
 from .simulation import FarmSimulation
 from .models import FarmState, AnimalState
+from .config import SimulationConfig
 
-__all__ = ['FarmSimulation', 'FarmState', 'AnimalState'] 
\ No newline at end of file
+__all__ = ['FarmSimulation', 'FarmState', 'AnimalState', 'SimulationConfig'] 
\ No newline at end of file
@@ -0,0 +1,84 @@
+import hashlib
+import json
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+def _default_weather_patterns() -> Dict[str, Dict]:
+    return {
+        'sunny': {'weight': 60, 'impact': {'feed': 1.0}},
+        'rainy': {'weight': 25, 'impact': {'milk': 0.8}},
+        'stormy': {'weight': 10, 'impact': {'egg': 0.5}},
+        'heatwave': {'weight': 5,  'impact': {'feed': 1.5}}
+    }
+
+
+def _default_production_rates() -> Dict[str, Dict]:
+    return {
+        'chicken': {'resource': 'eggs', 'base_rate': 3, 'health_factor': 0.02},
+        'cow': {'resource': 'milk', 'base_rate': 4, 'health_factor': 0.02}
+    }
+
+
+class SimulationConfig(BaseModel):
+    """Game balance knobs for a FarmSimulation.
+
+    The defaults reproduce the values the simulation has always used, so
+    ``FarmSimulation()`` behaves exactly as before.
+    """
+
+    weather_patterns: Dict[str, Dict] = _default_weather_patterns()
+    production_rates: Dict[str, Dict] = _default_production_rates()
+
+    # Market
+    feed_base_price: float = 0.75
+    feed_inflation_days: float = 30       # days for the feed volatility multiplier to grow by 1x
+    feed_inflation_cap: float = 5.0       # max feed volatility multiplier
+    feed_change_min: float = -0.05
+    feed_change_max: float = 0.25
+    feed_floor_days: float = 20           # days for the feed price floor to grow by 1x
+    price_change_min: float = -0.25
+    price_change_max: float = 0.35
+    min_price: float = 0.5
+    market_history_length: int = 30
+
+    # Diseases
+    disease_base_chance: float = 0.03
+    disease_chance_per_case: float = 0.02
+    disease_types: List[str] = ['avian_flu', 'hoof_rot', 'swine_fever']
+    disease_hunger_threshold: int = 5
+    disease_health_threshold: int = 40
+    disease_damage: float = 1
+    recovery_chance: float = 0.4
+    disease_death_health: float = 15
+
+    # Animals
+    animal_costs: Dict[str, float] = {'chicken': 50, 'cow': 200}
+    breeding_cooldown: int = 5
+
+    def with_overrides(self, overrides: Dict[str, Any]) -> 'SimulationConfig':
+        """Return a copy with dotted-path overrides applied.
+
+        ``{'weather_patterns.sunny.weight': 40, 'recovery_chance': 0.2}``
+        """
+        data = self.dict()
+        for path, value in overrides.items():
+            keys = path.split('.')
+            target = data
+            for key in keys[:-1]:
+                if not isinstance(target, dict) or key not in target:
+                    raise KeyError(f"Unknown config key: {path}")
+                target = target[key]
+            if not isinstance(target, dict) or keys[-1] not in target:
+                raise KeyError(f"Unknown config key: {path}")
+            target[keys[-1]] = value
+        return self.__class__(**data)
+
+    def config_hash(self) -> str:
+        """Stable hash of the config values, used to cache sweep results."""
+        # Round-trip through validation so unvalidated defaults (30 vs 30.0)
+        # hash the same as values that came through with_overrides
+        values = self.__class__(**self.dict()).dict()
+        payload = json.dumps(values, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
@@ -0,0 +1,158 @@
+"""
+Farmer policies for the tournament harness.
+
+``act(sims, day)`` is called once per day with every farm in the batch
+that still has animals. That leaves room to do per-day work once for the
+whole batch; the built-in policies have none, so they loop over the farms
+and make a few ``handle_*`` calls on each (roughly 15-25us per farm-day,
+about the cost of the simulation step itself). FarmerAgentPolicy instead
+runs FarmerAgent's actions on the farm state as written.
+"""
+import inspect
+from types import SimpleNamespace
+from typing import Dict, List, Type
+
+from .simulation import FarmSimulation
+
+try:
+    from .agents import FarmerAgent
+except ImportError:
+    # agents.py needs agentops at import time
+    FarmerAgent = None
+
+
+class FarmerPolicy:
+    name = 'base'
+
+    def act(self, sims: List[FarmSimulation], day: int):
+        raise NotImplementedError
+
+
+def _sell_produce(sim: FarmSimulation):
+    resources = sim.state.resources
+    for item in ('eggs', 'milk'):
+        quantity = int(resources.get(item, 0))
+        if quantity > 0:
+            sim.handle_sell(item, quantity)
+
+
+def _restock_feed(sim: FarmSimulation, below: float, amount: int, spend_fraction: float = 1.0):
+    """Buy up to ``amount`` feed when stock is under ``below``, within budget."""
+    resources = sim.state.resources
+    if resources['feed'] >= below:
+        return
+    budget = resources['money'] * spend_fraction
+    amount = min(amount, int(budget // sim.state.market_prices['feed']))
+    if amount > 0:
+        sim.handle_buy_feed(amount)
+
+
+class CaretakerPolicy(FarmerPolicy):
+    """The sweep baseline: feed, sell everything, keep a small feed buffer."""
+    name = 'caretaker'
+
+    def act(self, sims, day):
+        for sim in sims:
+            sim.handle_feed_animals()
+            _sell_produce(sim)
+            _restock_feed(sim, below=20, amount=50)
+
+
+class GreedySellerPolicy(FarmerPolicy):
+    """Sell all produce every day and only buy feed once it has run out."""
+    name = 'greedy_seller'
+
+    def act(self, sims, day):
+        for sim in sims:
+            _sell_produce(sim)
+            _restock_feed(sim, below=1, amount=10)
+            sim.handle_feed_animals()
+
+
+class FeedHoarderPolicy(FarmerPolicy):
+    """Pour most of the cash into feed while it is cheap, then live off the stock.
+
+    Feed counts as cheap up to ``cheap_factor`` times the config's base feed price.
+    """
+    name = 'feed_hoarder'
+    spend_fraction = 0.8
+    target_stock = 1000
+    cheap_factor = 2.0
+
+    def act(self, sims, day):
+        for sim in sims:
+            _sell_produce(sim)
+            if sim.state.market_prices['feed'] <= self.cheap_factor * sim.config.feed_base_price:
+                _restock_feed(sim, below=self.target_stock,
+                              amount=self.target_stock - int(sim.state.resources['feed']),
+                              spend_fraction=self.spend_fraction)
+            sim.handle_feed_animals()
+
+
+class BreederPolicy(CaretakerPolicy):
+    """Caretaker routine plus breeding every well-fed pair up to a herd cap.
+
+    A lone animal gets a mate bought for it once the farm can afford two.
+    """
+    name = 'breeder'
+    max_animals = 12
+
+    def act(self, sims, day):
+        super().act(sims, day)
+        for sim in sims:
+            animals = sim.state.animals
+            if len(animals) >= self.max_animals:
+                continue
+            by_type: Dict[str, List] = {}
+            for animal in animals:
+                by_type.setdefault(animal.type, []).append(animal)
+            for animal_type, herd in by_type.items():
+                if len(herd) == 1:
+                    cost = sim.config.animal_costs.get(animal_type)
+                    if cost is not None and sim.state.resources['money'] >= cost * 2:
+                        sim.handle_buy_animal(animal_type, f"Mate_{animal_type}_{day}")
+                    continue
+                ready = [a for a in herd
+                         if a.hunger <= 3 and a.name not in sim.breeding_cooldowns]
+                if len(ready) >= 2:
+                    sim.handle_breed(ready[0].name, ready[1].name)
+
+
+class FarmerAgentPolicy(FarmerPolicy):
+    """FarmerAgent's own feed_animals/collect_resources, run as written.
+
+    The agent mutates FarmState directly, so produce it "collects" is
+    removed from the farm rather than sold. Feed is restocked the same way
+    the caretaker does so the agent's actions are what gets measured.
+    Only registered when agentops is installed.
+    """
+    name = 'farmer_agent'
+
+    def __init__(self):
+        # Call the undecorated actions on a stand-in agent so nothing is
+        # recorded to AgentOps; they only read the farm state they're given
+        self.feed_animals = inspect.unwrap(FarmerAgent.feed_animals)
+        self.collect_resources = inspect.unwrap(FarmerAgent.collect_resources)
+        self.agent = SimpleNamespace(name='Harness', last_fed_day=None)
+
+    def act(self, sims, day):
+        agent = self.agent
+        for sim in sims:
+            self.feed_animals(agent, sim.state)
+            self.collect_resources(agent, sim.state)
+            _restock_feed(sim, below=20, amount=50)
+
+
+POLICIES: Dict[str, Type[FarmerPolicy]] = {
+    cls.name: cls for cls in (
+        CaretakerPolicy, GreedySellerPolicy, FeedHoarderPolicy, BreederPolicy,
+    )
+}
+if FarmerAgent is not None:
+    POLICIES[FarmerAgentPolicy.name] = FarmerAgentPolicy
+
+
+def register_policy(cls: Type[FarmerPolicy]) -> Type[FarmerPolicy]:
+    """Class decorator adding a policy to the tournament registry by its name."""
+    POLICIES[cls.name] = cls
+    return cls
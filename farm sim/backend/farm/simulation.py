@@ -1,25 +1,45 @@
+import copy
 import random
 from datetime import datetime, timedelta
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+def _no_record(event_type, data=None):
+    pass
 
 try:
     from agentops import record
     AGENTOPS_AVAILABLE = True
 except ImportError:
-    # Create a dummy record function that does nothing
-    def record(event_type, data=None):
-        pass
+    # Fall back to a record function that does nothing
+    record = _no_record
     AGENTOPS_AVAILABLE = False
 
+from .config import SimulationConfig
 from .models import FarmState, AnimalState
 
 class FarmSimulation:
-    def __init__(self):
+    def __init__(self, config: Optional[SimulationConfig] = None,
+                 seed: Optional[int] = None, headless: bool = False):
+        """
+        config: balance knobs, defaults to SimulationConfig()
+        seed: seeds this farm's private RNGs so runs are reproducible
+        headless: skip AgentOps event recording (used for batch sweeps)
+
+        env_rng drives the environment (weather and market prices) and rng
+        drives animals and diseases, so farms on the same seed see the same
+        weather and prices no matter how their herds differ.
+        """
+        self.config = config or SimulationConfig()
+        self.rng = random.Random(seed)
+        self.env_rng = random.Random(None if seed is None else f"env:{seed}")
+        self.headless = headless
+        self.record = _no_record if headless else record
+
         # Initialize with proper market prices for all resources
         initial_market_prices = {
             'eggs': 1.5,
             'milk': 3.0,
-            'feed': 0.75
+            'feed': self.config.feed_base_price
         }
         
         self.state = FarmState(
@@ -42,20 +62,13 @@ class FarmSimulation:
         )
         # the rest of your init code...
 
-        self.weather_patterns = {
-            'sunny': {'weight': 60, 'impact': {'feed': 1.0}},
-            'rainy': {'weight': 25, 'impact': {'milk': 0.8}},
-            'stormy': {'weight': 10, 'impact': {'egg': 0.5}},
-            'heatwave': {'weight': 5,  'impact': {'feed': 1.5}}
-        }
+        # Per-farm copies: the config is shared across a batch and hashed for caching
+        self.weather_patterns = copy.deepcopy(self.config.weather_patterns)
         self.last_update = datetime.now()
         self.breeding_cooldowns: Dict[str, int] = {}
 
         # Animal production rates
-        self.production_rates = {
-            'chicken': {'resource': 'eggs', 'base_rate': 3, 'health_factor': 0.02},
-            'cow': {'resource': 'milk', 'base_rate': 4, 'health_factor': 0.02}
-        }
+        self.production_rates = copy.deepcopy(self.config.production_rates)
 
     def get_state(self) -> Dict:
         return self.state.dict()
@@ -67,12 +80,12 @@ class FarmSimulation:
 
     def update_weather(self):
         total_weight = sum(w['weight'] for w in self.weather_patterns.values())
-        r = random.uniform(0, total_weight)
+        r = self.env_rng.uniform(0, total_weight)
         current = 0
         for weather, data in self.weather_patterns.items():
             if current + data['weight'] >= r:
                 if weather != self.state.weather:
-                    record('WeatherChange', {
+                    self.record('WeatherChange', {
                         'from': self.state.weather,
                         'to': weather,
                         'day': self.state.total_days
@@ -98,26 +111,28 @@ class FarmSimulation:
                 resource = production_info['resource']
                 self.state.resources[resource] += production
                 
-                record('ResourceProduced', {
+                self.record('ResourceProduced', {
                     'animal': animal.name,
                     'resource': resource,
                     'amount': production
                 })
 
     def spread_diseases(self):
+        cfg = self.config
         # Very rare disease chance
-        if random.random() < 0.03 + (len(self.state.diseases) * 0.02):  # Reduced from 0.08 to 0.03
-            disease = random.choice(['avian_flu', 'hoof_rot', 'swine_fever'])
+        if self.rng.random() < cfg.disease_base_chance + (len(self.state.diseases) * cfg.disease_chance_per_case):
+            disease = self.rng.choice(cfg.disease_types)
             # Only very weak animals get sick
-            eligible_animals = [a for a in self.state.animals if a.hunger > 5 or a.health < 40]  # More forgiving thresholds
+            eligible_animals = [a for a in self.state.animals
+                                if a.hunger > cfg.disease_hunger_threshold or a.health < cfg.disease_health_threshold]
             if eligible_animals:
-                animal = random.choice(eligible_animals)
+                animal = self.rng.choice(eligible_animals)
                 self.state.diseases.append({
                     'type': disease,
                     'animal': animal.name,
                     'start_day': self.state.total_days
                 })
-                record('DiseaseOutbreak', {'disease': disease, 'animal': animal.name})
+                self.record('DiseaseOutbreak', {'disease': disease, 'animal': animal.name})
 
         # Progress existing diseases
         for disease in self.state.diseases.copy():
@@ -127,13 +142,13 @@ class FarmSimulation:
                 continue
 
             # Very mild health damage from diseases
-            animal.health -= 1  # Reduced from 3 to 1
+            animal.health -= cfg.disease_damage
             
             # Easy recovery
             if animal.hunger <= 3 and animal.health >= 50:  # Much easier to recover
-                if random.random() < 0.4:  # Increased from 0.25 to 0.4
+                if self.rng.random() < cfg.recovery_chance:
                     self.state.diseases.remove(disease)
-                    record('AnimalRecovered', {
+                    self.record('AnimalRecovered', {
                         'name': animal.name,
                         'type': animal.type,
                         'disease': disease['type']
@@ -141,25 +156,26 @@ class FarmSimulation:
                     continue
 
             # Only die when extremely unhealthy
-            if animal.health <= 15:  # Reduced from 35 to 15
+            if animal.health <= cfg.disease_death_health:
                 self.state.animals.remove(animal)
                 self.state.diseases.remove(disease)
-                record('AnimalDied', {
+                self.record('AnimalDied', {
                     'name': animal.name,
                     'type': animal.type,
                     'cause': disease['type']
                 })
 
     def update_market(self):
+        cfg = self.config
         for item in self.state.market_prices:
             # Special handling for feed - price increases more aggressively over time
             if item == 'feed':
                 # More aggressive time-based inflation
-                time_factor = min(5.0, 1.0 + (self.state.total_days / 30))  # Max 5x multiplier, reaches max in 120 days
-                change = random.uniform(-0.05, 0.25) * time_factor  # Much more upward pressure
+                time_factor = min(cfg.feed_inflation_cap, 1.0 + (self.state.total_days / cfg.feed_inflation_days))
+                change = self.env_rng.uniform(cfg.feed_change_min, cfg.feed_change_max) * time_factor
                 
                 # Minimum price increases more rapidly
-                min_price = 0.75 * (1 + (self.state.total_days / 20))  # Base price increases 5% per day
+                min_price = cfg.feed_base_price * (1 + (self.state.total_days / cfg.feed_floor_days))
                 
                 # Apply both the random change and ensure minimum price
                 self.state.market_prices[item] = max(
@@ -168,21 +184,21 @@ class FarmSimulation:
                 )
             else:
                 # Normal fluctuation for other items
-                change = random.uniform(-0.25, 0.35)
-                self.state.market_prices[item] = max(0.5, 
+                change = self.env_rng.uniform(cfg.price_change_min, cfg.price_change_max)
+                self.state.market_prices[item] = max(cfg.min_price, 
                     self.state.market_prices[item] * (1 + change))
         
         self.state.market_history.append(self.state.market_prices.copy())
-        if len(self.state.market_history) > 30:
+        if len(self.state.market_history) > cfg.market_history_length:
             self.state.market_history.pop(0)
-        record('MarketUpdate', self.state.market_prices)
+        self.record('MarketUpdate', self.state.market_prices)
 
     def handle_buy_feed(self, amount: int):
         cost = int(amount) * self.state.market_prices['feed']
         if self.state.resources['money'] >= cost:
             self.state.resources['money'] -= cost
             self.state.resources['feed'] += int(amount)
-            record('FeedPurchased', {'amount': amount, 'cost': cost})
+            self.record('FeedPurchased', {'amount': amount, 'cost': cost})
             self.check_achievement('farmer')
             return {"success": f"Bought {amount} feed for ${cost:.2f}"}
         return {"error": f"Need ${cost:.2f} to buy feed"}
@@ -204,7 +220,7 @@ class FarmSimulation:
                 fed_animals.append(animal.name)
 
         if fed_animals:
-            record('AnimalsFed', {'animals': fed_animals})
+            self.record('AnimalsFed', {'animals': fed_animals})
             return {"success": f"Fed animals: {', '.join(fed_animals)}"}
         return {"error": "No hungry animals to feed"}
 
@@ -217,7 +233,7 @@ class FarmSimulation:
         earnings = quantity * self.state.market_prices[item]
         self.state.resources[item] -= quantity
         self.state.resources['money'] += earnings
-        record('ItemSold', {'item': item, 'quantity': quantity, 'earnings': earnings})
+        self.record('ItemSold', {'item': item, 'quantity': quantity, 'earnings': earnings})
         self.check_achievement('farmer')
         return {"success": f"Sold {quantity} {item} for ${earnings:.2f}"}
 
@@ -244,9 +260,9 @@ class FarmSimulation:
             age=0
         )
         self.state.animals.append(baby)
-        self.breeding_cooldowns[animal1.name] = 5  # e.g. 5 day cooldown
-        self.breeding_cooldowns[animal2.name] = 5
-        record('AnimalBred', {
+        self.breeding_cooldowns[animal1.name] = self.config.breeding_cooldown
+        self.breeding_cooldowns[animal2.name] = self.config.breeding_cooldown
+        self.record('AnimalBred', {
             'parent1': animal1.name,
             'parent2': animal2.name,
             'baby': baby.name
@@ -259,7 +275,7 @@ class FarmSimulation:
         for animal in self.state.animals:
             animal.age += 1
             # Very slow hunger increase
-            animal.hunger += random.randint(1, 2)  # Reduced from 2-4 to 1-2
+            animal.hunger += self.rng.randint(1, 2)  # Reduced from 2-4 to 1-2
             
             # Minimal health loss from hunger
             if animal.hunger > 5:  # Changed from 3 to 5
@@ -273,7 +289,7 @@ class FarmSimulation:
             # Only die in extreme cases
             if animal.hunger >= 15 or animal.health <= 10:  # Much more forgiving thresholds
                 self.state.animals.remove(animal)
-                record('AnimalDied', {
+                self.record('AnimalDied', {
                     'name': animal.name,
                     'type': animal.type,
                     'cause': 'starvation' if animal.hunger >= 15 else 'poor_health'
@@ -298,7 +314,8 @@ class FarmSimulation:
         self.update_market()
         self.spread_time_effects()
         self.last_update = datetime.now()
-        record('DailyUpdate', self.state.dict())
+        if self.record is not _no_record:  # skip building the snapshot when nothing records it
+            self.record('DailyUpdate', self.state.dict())
         return True
 
     def check_achievement(self, category: str):
@@ -315,15 +332,11 @@ class FarmSimulation:
         for name, condition in achievements_map.get(category, []):
             if condition and name not in self.state.achievements:
                 self.state.achievements.append(name)
-                record('AchievementUnlocked', {'name': name})
+                self.record('AchievementUnlocked', {'name': name})
 
     def handle_buy_animal(self, animal_type: str, name: str) -> Dict:
         """Buy a new animal for the farm"""
-        # Define costs for different animal types
-        costs = {
-            'chicken': 50,
-            'cow': 200
-        }
+        costs = self.config.animal_costs
         
         if animal_type not in costs:
             return {"error": f"Invalid animal type: {animal_type}"}
@@ -349,7 +362,7 @@ class FarmSimulation:
         self.state.animals.append(new_animal)
         self.state.resources['money'] -= cost
         
-        record('AnimalPurchased', {
+        self.record('AnimalPurchased', {
             'type': animal_type,
             'name': name,
             'cost': cost
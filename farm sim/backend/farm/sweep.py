@@ -0,0 +1,200 @@
+"""
+Scenario sweeps: evaluate many SimulationConfig variants across seeded,
+headless farms on a process pool.
+
+    runner = SweepRunner(days=365, seeds=range(8), cache_path='sweep.jsonl')
+    for result in runner.run(grid({'recovery_chance': [0.2, 0.4],
+                                   'animal_costs.cow': [150, 200]})):
+        print(result['overrides'], result['metrics']['money_mean'])
+
+Results stream back as workers finish. With a cache_path every result is
+appended to a JSONL file keyed by run hash, and re-running the same sweep
+skips anything already in the file.
+"""
+import hashlib
+import itertools
+import json
+import os
+import random
+import statistics
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .config import SimulationConfig
+from .policies import CaretakerPolicy
+from .tournament import run_batch
+
+# Part of every cache key. Bump it whenever a change to the simulation, the
+# caretaker routine or the metrics would make older cached results wrong.
+CACHE_VERSION = 3
+
+METRIC_KEYS = frozenset({
+    'money_mean', 'money_std', 'survival_rate',
+    'days_survived_mean', 'herd_mean', 'achievements_mean',
+})
+
+
+def grid(space: Dict[str, Sequence]) -> Iterator[Dict[str, Any]]:
+    """Yield every combination of the values in ``space`` as an overrides dict."""
+    keys = list(space)
+    for values in itertools.product(*(space[k] for k in keys)):
+        yield dict(zip(keys, values))
+
+
+def random_samples(space: Dict[str, Any], n: int, seed: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Yield ``n`` random overrides dicts drawn from ``space``.
+
+    ``{'range': [low, high]}`` is sampled uniformly (as an int if both
+    bounds are ints); any other sequence is a list of choices.
+    """
+    rng = random.Random(seed)
+    for _ in range(n):
+        overrides = {}
+        for key, spec in space.items():
+            if isinstance(spec, dict):
+                low, high = spec['range']
+                if isinstance(low, int) and isinstance(high, int):
+                    overrides[key] = rng.randint(low, high)
+                else:
+                    overrides[key] = rng.uniform(low, high)
+            else:
+                overrides[key] = rng.choice(list(spec))
+        yield overrides
+
+
+def _summarise(runs: List[Dict]) -> Dict[str, float]:
+    money = [r['money'] for r in runs]
+    return {
+        'money_mean': statistics.fmean(money),
+        'money_std': statistics.pstdev(money),
+        'survival_rate': sum(r['survived'] for r in runs) / len(runs),
+        'days_survived_mean': statistics.fmean(r['days_survived'] for r in runs),
+        'herd_mean': statistics.fmean(r['herd'] for r in runs),
+        'achievements_mean': statistics.fmean(len(r['achievements']) for r in runs),
+    }
+
+
+def run_key(config: SimulationConfig, seeds: Sequence[int], days: int) -> str:
+    """Cache key for one sweep point: config values, run setup and CACHE_VERSION."""
+    payload = f"v{CACHE_VERSION}:{config.config_hash()}:{days}:{','.join(map(str, seeds))}"
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def evaluate(base: Dict, overrides: Dict[str, Any], seeds: Sequence[int], days: int) -> Dict:
+    """Worker entrypoint: build the config, run every seed under the caretaker, return one result."""
+    config = SimulationConfig(**base).with_overrides(overrides)
+    runs = run_batch(CaretakerPolicy, seeds, days, config)
+    return {
+        'key': run_key(config, seeds, days),
+        'version': CACHE_VERSION,
+        'config_hash': config.config_hash(),
+        'overrides': overrides,
+        'days': days,
+        'seeds': len(seeds),
+        'metrics': _summarise(runs),
+    }
+
+
+class SweepRunner:
+    def __init__(self, days: int = 365, seeds: Iterable[int] = range(8),
+                 base_config: Optional[SimulationConfig] = None,
+                 workers: Optional[int] = None, cache_path: Optional[str] = None):
+        self.days = days
+        self.seeds = list(seeds)
+        self.base_config = base_config or SimulationConfig()
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = cache_path
+
+    def load_cache(self) -> Dict[str, Dict]:
+        """Read previously finished results, keyed by run hash.
+
+        Records from another CACHE_VERSION or with a different set of metrics
+        are skipped, so those points are run again.
+        """
+        cached = {}
+        if self.cache_path and os.path.exists(self.cache_path):
+            with open(self.cache_path) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        result = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # partial line from an interrupted sweep
+                    if (result.get('version') != CACHE_VERSION
+                            or set(result.get('metrics', {})) != METRIC_KEYS):
+                        continue
+                    cached[result['key']] = result
+        return cached
+
+    def run(self, points: Iterable[Dict[str, Any]]) -> Iterator[Dict]:
+        """Evaluate every overrides dict in ``points``, yielding results as they finish.
+
+        Cached results are yielded first (with ``'cached': True``); the rest
+        are submitted to the pool with a bounded number in flight, so huge or
+        lazy point generators don't pile up in memory.
+        """
+        cached = self.load_cache()
+        base = self.base_config.dict()
+        max_in_flight = self.workers * 4
+        seen = set()
+
+        cache_file = open(self.cache_path, 'a') if self.cache_path else None
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                pending = set()
+                for overrides in points:
+                    key = run_key(self.base_config.with_overrides(overrides), self.seeds, self.days)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    if key in cached:
+                        yield {**cached[key], 'cached': True}
+                        continue
+
+                    pending.add(pool.submit(evaluate, base, overrides, self.seeds, self.days))
+                    if len(pending) >= max_in_flight:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        yield from self._finish(done, cache_file)
+
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from self._finish(done, cache_file)
+        finally:
+            if cache_file:
+                cache_file.close()
+
+    def _finish(self, done, cache_file) -> Iterator[Dict]:
+        for future in done:
+            result = future.result()
+            if cache_file:
+                cache_file.write(json.dumps(result) + '\n')
+                cache_file.flush()
+            yield result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a farm balance sweep")
+    parser.add_argument('space', help="JSON file mapping dotted config keys to value lists, "
+                                      "or to {\"range\": [low, high]} with --samples")
+    parser.add_argument('--samples', type=int, help="draw N random configs instead of a full grid")
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--seeds', type=int, default=8)
+    parser.add_argument('--workers', type=int)
+    parser.add_argument('--cache', help="JSONL file to cache and resume results")
+    args = parser.parse_args()
+
+    with open(args.space) as f:
+        space = json.load(f)
+    if args.samples:
+        points = random_samples(space, args.samples, seed=0)
+    else:
+        points = grid(space)
+
+    runner = SweepRunner(days=args.days, seeds=range(args.seeds),
+                         workers=args.workers, cache_path=args.cache)
+    for result in runner.run(points):
+        print(json.dumps(result))
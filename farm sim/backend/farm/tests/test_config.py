@@ -0,0 +1,45 @@
+import pytest
+
+from farm import FarmSimulation, SimulationConfig
+
+
+def test_with_overrides_sets_nested_keys_without_touching_original():
+    base = SimulationConfig()
+    tuned = base.with_overrides({'weather_patterns.sunny.weight': 40, 'recovery_chance': 0.2})
+    assert tuned.weather_patterns['sunny']['weight'] == 40
+    assert tuned.recovery_chance == 0.2
+    assert base.weather_patterns['sunny']['weight'] == 60
+    assert base.recovery_chance == 0.4
+
+
+@pytest.mark.parametrize('path', ['no_such_knob', 'weather_patterns.foggy.weight', 'recovery_chance.x'])
+def test_with_overrides_rejects_unknown_keys(path):
+    with pytest.raises(KeyError):
+        SimulationConfig().with_overrides({path: 1})
+
+
+def test_config_hash_is_stable_and_value_based():
+    assert SimulationConfig().config_hash() == SimulationConfig().config_hash()
+    assert SimulationConfig().with_overrides({}).config_hash() == SimulationConfig().config_hash()
+    assert SimulationConfig(recovery_chance=0.1).config_hash() != SimulationConfig().config_hash()
+
+
+def test_same_seed_reproduces_the_same_run():
+    a = FarmSimulation(seed=7, headless=True)
+    b = FarmSimulation(seed=7, headless=True)
+    for _ in range(100):
+        a.advance_time()
+        b.advance_time()
+    assert a.state == b.state
+
+
+def test_farms_do_not_share_the_configs_tables():
+    config = SimulationConfig()
+    a = FarmSimulation(config=config, headless=True)
+    b = FarmSimulation(config=config, headless=True)
+    before = config.config_hash()
+    a.weather_patterns['sunny']['weight'] = 0
+    a.production_rates['cow']['base_rate'] = 99
+    assert b.weather_patterns['sunny']['weight'] == 60
+    assert b.production_rates['cow']['base_rate'] == 4
+    assert config.config_hash() == before
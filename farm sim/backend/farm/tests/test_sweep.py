@@ -0,0 +1,105 @@
+import json
+from concurrent.futures import Future
+
+import pytest
+
+from farm import SimulationConfig
+from farm import sweep
+from farm.sweep import SweepRunner, grid, random_samples, run_key
+
+
+class InlineExecutor:
+    """Runs submitted work in-process and counts submissions."""
+    submitted = 0
+
+    def __init__(self, max_workers=None):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        InlineExecutor.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture
+def inline_pool(monkeypatch):
+    InlineExecutor.submitted = 0
+    monkeypatch.setattr(sweep, 'ProcessPoolExecutor', InlineExecutor)
+    return InlineExecutor
+
+
+def test_grid_covers_every_combination():
+    points = list(grid({'a': [1, 2], 'b': ['x', 'y', 'z']}))
+    assert len(points) == 6
+    assert {'a': 2, 'b': 'z'} in points
+
+
+def test_random_samples_ranges_and_choices():
+    points = list(random_samples({'n': {'range': [0, 3]}, 'f': {'range': [0.1, 0.2]},
+                                  'c': [0.2, 0.4], 's': ['a', 'b']}, 50, seed=0))
+    assert all(isinstance(p['n'], int) and 0 <= p['n'] <= 3 for p in points)
+    assert all(0.1 <= p['f'] <= 0.2 for p in points)
+    assert {p['c'] for p in points} <= {0.2, 0.4}
+    assert {p['s'] for p in points} <= {'a', 'b'}
+
+
+def test_run_key_depends_on_config_days_and_seeds():
+    config = SimulationConfig()
+    key = run_key(config, [0, 1], 30)
+    assert key == run_key(SimulationConfig(), [0, 1], 30)
+    assert key != run_key(config, [0, 1], 31)
+    assert key != run_key(config, [0, 2], 30)
+    assert key != run_key(config.with_overrides({'recovery_chance': 0.1}), [0, 1], 30)
+
+
+def test_rerun_is_served_from_cache(tmp_path, inline_pool):
+    cache = tmp_path / 'sweep.jsonl'
+    points = list(grid({'recovery_chance': [0.2, 0.4]}))
+
+    first = list(SweepRunner(days=20, seeds=range(2), workers=1, cache_path=str(cache)).run(points))
+    assert inline_pool.submitted == 2
+    assert not any(r.get('cached') for r in first)
+
+    second = list(SweepRunner(days=20, seeds=range(2), workers=1, cache_path=str(cache)).run(points))
+    assert inline_pool.submitted == 2
+    assert all(r['cached'] for r in second)
+    assert sorted(r['key'] for r in second) == sorted(r['key'] for r in first)
+
+
+def test_evaluate_reports_survival_as_a_rate_of_farms():
+    result = sweep.evaluate(SimulationConfig().dict(), {}, seeds=[0, 1, 2], days=120)
+    metrics = result['metrics']
+    assert set(metrics) == sweep.METRIC_KEYS
+    assert 0.0 <= metrics['survival_rate'] <= 1.0
+    assert metrics['days_survived_mean'] <= 120
+
+
+def test_run_key_changes_with_cache_version(monkeypatch):
+    key = run_key(SimulationConfig(), [0], 30)
+    monkeypatch.setattr(sweep, 'CACHE_VERSION', sweep.CACHE_VERSION + 1)
+    assert run_key(SimulationConfig(), [0], 30) != key
+
+
+def test_stale_cache_records_are_rerun(tmp_path, inline_pool):
+    cache = tmp_path / 'sweep.jsonl'
+    runner = SweepRunner(days=20, seeds=range(2), workers=1, cache_path=str(cache))
+    key = run_key(SimulationConfig(), runner.seeds, runner.days)
+    stale = [
+        {'key': key, 'version': sweep.CACHE_VERSION - 1,
+         'metrics': dict.fromkeys(sweep.METRIC_KEYS, 0.0)},
+        {'key': key, 'version': sweep.CACHE_VERSION,
+         'metrics': {'survival_mean': 1.0, 'extinct_rate': 0.0}},
+    ]
+    cache.write_text(''.join(json.dumps(r) + '\n' for r in stale))
+
+    results = list(runner.run([{}]))
+    assert inline_pool.submitted == 1
+    assert not results[0].get('cached')
+    assert set(results[0]['metrics']) == sweep.METRIC_KEYS
@@ -0,0 +1,141 @@
+import functools
+import importlib
+import sys
+import types
+
+import pytest
+
+import farm.policies
+from farm import FarmSimulation
+from farm.policies import POLICIES, BreederPolicy, CaretakerPolicy, FeedHoarderPolicy
+from farm.tournament import proportion_ci, run_batch, run_tournament
+
+
+def _play(policy, seed, days):
+    sim = FarmSimulation(seed=seed, headless=True)
+    weather = []
+    for day in range(1, days + 1):
+        sim.advance_time()
+        weather.append(sim.state.weather)
+        if sim.state.animals:
+            policy.act([sim], day)
+    return sim, weather
+
+
+def test_policies_share_weather_and_market_on_the_same_seed():
+    caretaker, caretaker_weather = _play(CaretakerPolicy(), seed=3, days=40)
+    breeder, breeder_weather = _play(BreederPolicy(), seed=3, days=40)
+    # The breeder buys and breeds animals, so the herds diverge...
+    assert len(breeder.state.animals) != len(caretaker.state.animals)
+    # ...but the weather and prices they face do not
+    assert breeder_weather == caretaker_weather
+    assert breeder.state.market_history == caretaker.state.market_history
+
+
+def test_proportion_ci_stays_in_bounds():
+    for outcomes in ([True] * 200, [False] * 200, [True] * 197 + [False] * 3):
+        ci = proportion_ci(outcomes)
+        assert 0.0 <= ci['low'] <= ci['mean'] <= ci['high'] <= 1.0
+        assert ci['high'] - ci['low'] > 0
+
+
+def test_unknown_policy_is_rejected_before_running():
+    with pytest.raises(ValueError):
+        run_tournament(['caretaker', 'no_such_policy'], farms=2, days=5, workers=1)
+
+
+def test_every_registered_policy_runs():
+    results = run_tournament(POLICIES, farms=4, days=10, batch_size=2, workers=1)
+    assert set(results) == set(POLICIES)
+    assert all(r['farms'] == 4 for r in results.values())
+
+
+@pytest.fixture
+def reload_policies(monkeypatch):
+    """Reload farm.policies against a given ``agentops`` module, restoring it afterwards.
+
+    The original module contents are put back (rather than reloading again)
+    so classes imported elsewhere stay the same objects and still pickle.
+    """
+    original = dict(vars(farm.policies))
+
+    def reload(agentops):
+        monkeypatch.setitem(sys.modules, 'agentops', agentops)
+        sys.modules.pop('farm.agents', None)
+        return importlib.reload(farm.policies)
+
+    yield reload
+    monkeypatch.undo()
+    sys.modules.pop('farm.agents', None)
+    vars(farm.policies).clear()
+    vars(farm.policies).update(original)
+
+
+def _fake_agentops(recorded):
+    def action(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            recorded.append(fn.__name__)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    module = types.ModuleType('agentops')
+    module.agent = lambda **kwargs: (lambda cls: cls)
+    module.action = action
+    return module
+
+
+def test_farmer_agent_policy_feeds_and_collects_without_recording(reload_policies):
+    recorded = []
+    policies = reload_policies(_fake_agentops(recorded))
+    assert policies.POLICIES['farmer_agent'] is policies.FarmerAgentPolicy
+
+    sim = FarmSimulation(seed=0, headless=True)
+    for animal in sim.state.animals:
+        animal.hunger = 5
+    feed = sim.state.resources['feed']
+    policies.FarmerAgentPolicy().act([sim], day=1)
+
+    assert all(animal.hunger < 5 for animal in sim.state.animals)
+    assert sim.state.resources['feed'] == feed - 3  # 1 for the chicken, 2 for the cow
+    assert sim.state.resources['eggs'] == 0
+    assert sim.state.resources['milk'] == 0
+    assert recorded == []
+
+    results = run_batch(policies.FarmerAgentPolicy, [0, 1], 10)
+    assert [r['seed'] for r in results] == [0, 1]
+    assert recorded == []
+
+
+def test_farmer_agent_policy_is_not_registered_without_agentops(reload_policies):
+    policies = reload_policies(None)  # a None entry makes ``import agentops`` raise ImportError
+    assert policies.FarmerAgent is None
+    assert 'farmer_agent' not in policies.POLICIES
+
+
+def test_repeated_policies_run_once():
+    results = run_tournament(['caretaker', CaretakerPolicy, 'caretaker'], farms=3, days=5, workers=1)
+    assert list(results) == ['caretaker']
+    assert results['caretaker']['farms'] == 3
+
+
+def test_policies_need_distinct_names():
+    class Unnamed(CaretakerPolicy):
+        name = 'base'
+
+    class Impostor(CaretakerPolicy):
+        pass  # inherits 'caretaker'
+
+    with pytest.raises(ValueError):
+        run_tournament([Unnamed], farms=2, days=5, workers=1)
+    with pytest.raises(ValueError):
+        run_tournament(['caretaker', Impostor], farms=2, days=5, workers=1)
+
+
+def test_feed_hoarder_only_buys_cheap_feed():
+    cheap = FarmSimulation(seed=0, headless=True)
+    pricey = FarmSimulation(seed=0, headless=True)
+    pricey.state.market_prices['feed'] = 3 * pricey.config.feed_base_price
+    FeedHoarderPolicy().act([cheap, pricey], day=1)
+    assert cheap.state.resources['feed'] > 100
+    assert pricey.state.resources['feed'] <= 100
@@ -0,0 +1,173 @@
+"""
+Policy tournaments: run farmer policies against thousands of seeded,
+headless farms in parallel and report money, survival and achievement
+metrics with 95% confidence intervals.
+
+    results = run_tournament(['caretaker', 'breeder'], farms=2000, days=365)
+    print(format_report(results))
+
+Every policy plays the same seeds, so weather and market noise is shared
+across policies and differences come from the policies themselves. Farms
+are split into batches; each worker steps its whole batch one day at a
+time and hands the live farms to the policy in a single ``act`` call,
+which still visits each farm.
+"""
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Sequence, Type, Union
+
+from .config import SimulationConfig
+from .policies import POLICIES, FarmerPolicy
+from .simulation import FarmSimulation
+
+ACHIEVEMENTS = ('feed_purchased', 'millionaire', 'prolific')
+
+
+def run_batch(policy_cls: Type[FarmerPolicy], seeds: Sequence[int], days: int,
+              config: Optional[SimulationConfig] = None) -> List[Dict]:
+    """Worker entrypoint: play ``policy_cls`` on one farm per seed for ``days``.
+
+    Returns one result per farm. A farm survived if it still has animals at
+    the end; ``days_survived`` is the day its last animal died, or ``days``.
+    """
+    policy = policy_cls()
+    sims = [FarmSimulation(config=config, seed=seed, headless=True) for seed in seeds]
+    extinct_day: Dict[int, int] = {}
+
+    alive = list(range(len(sims)))
+    for day in range(1, days + 1):
+        for i in alive:
+            sims[i].advance_time()
+        still_alive = []
+        for i in alive:
+            if sims[i].state.animals:
+                still_alive.append(i)
+            else:
+                extinct_day[i] = day
+        alive = still_alive
+        if not alive:
+            break
+        policy.act([sims[i] for i in alive], day)
+
+    results = []
+    for i, sim in enumerate(sims):
+        results.append({
+            'seed': seeds[i],
+            'money': sim.state.resources['money'],
+            'survived': bool(sim.state.animals),
+            'herd': len(sim.state.animals),
+            'days_survived': extinct_day.get(i, days),
+            'achievements': list(sim.state.achievements),
+        })
+    return results
+
+
+def mean_ci(values: Sequence[float], z: float = 1.96) -> Dict[str, float]:
+    """Mean of a continuous metric with a normal-approximation confidence interval."""
+    mean = statistics.fmean(values)
+    half = z * statistics.stdev(values) / math.sqrt(len(values)) if len(values) > 1 else 0.0
+    return {'mean': mean, 'low': mean - half, 'high': mean + half}
+
+
+def proportion_ci(outcomes: Sequence[bool], z: float = 1.96) -> Dict[str, float]:
+    """Rate of a yes/no outcome with a Wilson score interval.
+
+    Unlike the normal approximation this stays inside [0, 1] and gives a
+    non-zero width at rates of exactly 0% or 100%.
+    """
+    n = len(outcomes)
+    p = sum(outcomes) / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return {'mean': p, 'low': max(0.0, centre - half), 'high': min(1.0, centre + half)}
+
+
+def summarise(runs: List[Dict]) -> Dict:
+    summary = {
+        'farms': len(runs),
+        'money': mean_ci([r['money'] for r in runs]),
+        'survival': proportion_ci([r['survived'] for r in runs]),
+        'herd': mean_ci([r['herd'] for r in runs]),
+        'days_survived': mean_ci([r['days_survived'] for r in runs]),
+        'achievements': {},
+    }
+    for name in ACHIEVEMENTS:
+        summary['achievements'][name] = proportion_ci([name in r['achievements'] for r in runs])
+    return summary
+
+
+def run_tournament(policies: Iterable[Union[str, Type[FarmerPolicy]]], farms: int = 1000,
+                   days: int = 365, seed: int = 0, batch_size: int = 250,
+                   workers: Optional[int] = None,
+                   config: Optional[SimulationConfig] = None) -> Dict[str, Dict]:
+    """Evaluate each policy on ``farms`` seeded farms and return a summary per policy.
+
+    ``policies`` may be registry names or FarmerPolicy subclasses; repeats of
+    the same policy are run once. Policies are checked before any work is
+    submitted, and each needs its own ``name`` since results are keyed by it.
+    """
+    classes = []
+    for p in policies:
+        if isinstance(p, str):
+            if p not in POLICIES:
+                raise ValueError(f"Unknown policy: {p} (available: {', '.join(POLICIES)})")
+            p = POLICIES[p]
+        if p in classes:
+            continue
+        if p.name == FarmerPolicy.name:
+            raise ValueError(f"{p.__name__} needs its own name")
+        if any(cls.name == p.name for cls in classes):
+            raise ValueError(f"Duplicate policy name: {p.name}")
+        classes.append(p)
+    seeds = list(range(seed, seed + farms))
+    batches = [seeds[i:i + batch_size] for i in range(0, farms, batch_size)]
+
+    runs: Dict[str, List[Dict]] = {cls.name: [] for cls in classes}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1) as pool:
+        futures = {
+            pool.submit(run_batch, cls, batch, days, config): cls.name
+            for cls in classes for batch in batches
+        }
+        for future in as_completed(futures):
+            runs[futures[future]].extend(future.result())
+
+    return {name: summarise(policy_runs) for name, policy_runs in runs.items()}
+
+
+def format_report(results: Dict[str, Dict]) -> str:
+    def fmt(ci, pct=False):
+        if pct:
+            return f"{ci['mean']:.1%} [{ci['low']:.1%}, {ci['high']:.1%}]"
+        return f"{ci['mean']:.2f} [{ci['low']:.2f}, {ci['high']:.2f}]"
+
+    lines = []
+    for name, summary in sorted(results.items(), key=lambda kv: -kv[1]['money']['mean']):
+        lines.append(f"{name} ({summary['farms']} farms)")
+        lines.append(f"  money:           {fmt(summary['money'])}")
+        lines.append(f"  survival:        {fmt(summary['survival'], pct=True)}")
+        lines.append(f"  days survived:   {fmt(summary['days_survived'])}")
+        lines.append(f"  herd size:       {fmt(summary['herd'])}")
+        for achievement, ci in summary['achievements'].items():
+            lines.append(f"  {achievement + ':':<16} {fmt(ci, pct=True)}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a farmer policy tournament")
+    parser.add_argument('policies', nargs='*', default=list(POLICIES),
+                        help=f"policies to evaluate (available: {', '.join(POLICIES)})")
+    parser.add_argument('--farms', type=int, default=1000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch-size', type=int, default=250)
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+
+    results = run_tournament(args.policies, farms=args.farms, days=args.days, seed=args.seed,
+                             batch_size=args.batch_size, workers=args.workers)
+    print(format_report(results))